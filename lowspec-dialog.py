@@ -11,20 +11,24 @@ import os
 import locale
 import gettext
 
-import gi
-gi.require_version('Gtk', '4.0')
-gi.require_version('Adw', '1')
-from gi.repository import GLib, Gtk, Adw
+from praya_gi import GLib, Gtk, Adw
 
-# Setup translations
-locale.setlocale(locale.LC_ALL, '')
+# Setup translations lazily: the setlocale call and the .mo mmap only
+# happen if a string is actually translated
 script_dir = os.path.dirname(os.path.abspath(__file__))
 localedir = os.path.join(script_dir, 'locale')
-try:
-    t = gettext.translation('praya', localedir=localedir)
-except FileNotFoundError:
-    t = gettext.NullTranslations()
-_ = t.gettext
+_t = None
+
+
+def _(s):
+    global _t
+    if _t is None:
+        locale.setlocale(locale.LC_ALL, '')
+        try:
+            _t = gettext.translation('praya', localedir=localedir)
+        except FileNotFoundError:
+            _t = gettext.NullTranslations()
+    return _t.gettext(s)
 
 
 class LowspecApp(Adw.Application):
@@ -36,25 +40,21 @@ class LowspecApp(Adw.Application):
         GLib.set_prgname('Prihatin')
         GLib.set_application_name('Prihatin')
 
-        # Create a hidden parent window so the dialog appears centered
-        parent = Adw.ApplicationWindow(application=self)
-        parent.set_title('Prihatin')
-        parent.set_default_size(1, 1)
-        parent.present()
+        # No parent window — the compositor centers the dialog on its own.
+        # Hold the app so it stays alive while the dialog is up instead of
+        # relying on a hidden window.
+        self.hold()
 
         dialog = Adw.MessageDialog(
-            transient_for=parent,
             modal=True,
-            heading='\U0001F422',
+            # Pango markup for large emoji (61440 = 60pt * 1024 Pango units)
+            heading='<span size="61440">\U0001F422</span>',
             heading_use_markup=True,
             body=_("Not all hardware is the same, and that's okay. "
                    "If your device needs a little help, just switch off some "
                    "features to get better performance. You can tweak this "
                    "later in Praya Preferences."),
         )
-        # Use Pango markup for large emoji (61440 = 60pt * 1024 Pango units)
-        dialog.set_heading('<span size="61440">\U0001F422</span>')
-        dialog.set_heading_use_markup(True)
 
         dialog.add_response('ignore', _('Ignore'))
         dialog.add_response('apply', _('Disable a few features'))
@@ -69,7 +69,9 @@ class LowspecApp(Adw.Application):
             self.exit_code = 0
         elif response == 'apply':
             self.exit_code = 1
-        self.quit()
+        # Drops the hold taken in do_activate; the use count reaching
+        # zero ends the main loop, no explicit quit() needed
+        self.release()
 
 
 def main():
@@ -8,17 +8,29 @@ Reads and writes:
 The GNOME Shell extension watches these files via Gio.FileMonitor and
 applies changes live.
 """
-import json
 import os
 import sys
 import locale
 import gettext
-import subprocess
 
-import gi
-gi.require_version('Gtk', '4.0')
-gi.require_version('Adw', '1')
-from gi.repository import GLib, Gtk, Adw, Gio
+# Prefer orjson when available — noticeably faster parse/serialize and it
+# produces bytes directly; fall back to the stdlib otherwise
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(data):
+        return (json.dumps(data, indent=2) + '\n').encode()
+
+from praya_gi import GLib, Gtk, Adw, Gio
 
 # -- Keep in sync with constants.js -------------------------------------------
 VERSION = '0.1.33'
@@ -33,6 +45,9 @@ PROVIDERS = {
         'models': ['gpt-4o', 'gpt-4o-mini', 'gpt-4-turbo'],
     },
 }
+
+PROVIDER_KEYS = tuple(PROVIDERS.keys())
+PROVIDER_NAMES = tuple(PROVIDERS[k]['name'] for k in PROVIDER_KEYS)
 # ------------------------------------------------------------------------------
 
 # D-Bus constants for posture service
@@ -42,15 +57,49 @@ POSTURE_MAIN_PATH = '/com/github/blankon/Praya'
 POSTURE_SERVICE_INTERFACE = 'com.github.blankon.Praya.Posture'
 POSTURE_SERVICE_PATH = '/com/github/blankon/Praya/Posture'
 
-# Setup translations (same pattern as lowspec-dialog.py)
-locale.setlocale(locale.LC_ALL, '')
+# D-Bus constants for the user systemd instance (service status)
+SYSTEMD_BUS_NAME = 'org.freedesktop.systemd1'
+SYSTEMD_PATH = '/org/freedesktop/systemd1'
+SYSTEMD_MANAGER_INTERFACE = 'org.freedesktop.systemd1.Manager'
+SYSTEMD_UNIT_INTERFACE = 'org.freedesktop.systemd1.Unit'
+DBUS_PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+PRAYA_UNIT = 'praya.service'
+
+# Setup translations lazily (same pattern as lowspec-dialog.py): the
+# setlocale call and the .mo mmap only happen on the first lookup
 script_dir = os.path.dirname(os.path.abspath(__file__))
 localedir = os.path.join(script_dir, 'locale')
-try:
-    t = gettext.translation('praya', localedir=localedir)
-except FileNotFoundError:
-    t = gettext.NullTranslations()
-_ = t.gettext
+_t = None
+
+
+def _(s):
+    global _t
+    if _t is None:
+        locale.setlocale(locale.LC_ALL, '')
+        try:
+            _t = gettext.translation('praya', localedir=localedir)
+        except FileNotFoundError:
+            _t = gettext.NullTranslations()
+    return _t.gettext(s)
+
+
+# Gtk.Builder translates .ui strings through the C gettext domain, so
+# bind it to the same catalog (glibc only, hence the guard). This just
+# records the path — no I/O until the builder looks a string up.
+if hasattr(locale, 'bindtextdomain'):
+    locale.bindtextdomain('praya', localedir)
+
+# Static widget structure lives in the builder file; the _build_*_page
+# methods only apply config state and connect signals
+UI_PATH = os.path.join(script_dir, 'preferences.ui')
+
+HOVER_KEYS = (
+    'mainMenuHoverActivate',
+    'taskbarHoverActivate',
+    'showDesktopHoverActivate',
+    'calendarHoverActivate',
+    'quickAccessHoverActivate',
+)
 
 # Config paths
 CONFIG_DIR = os.path.join(GLib.get_user_config_dir(), 'praya')
@@ -83,21 +132,26 @@ def _ensure_config_dir():
 
 def _load_json(path, defaults):
     try:
-        with open(path, 'r') as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
         # Merge with defaults so new keys are always present
-        merged = dict(defaults)
-        merged.update(data)
-        return merged
-    except (FileNotFoundError, json.JSONDecodeError):
+        return {**defaults, **data}
+    except (FileNotFoundError, ValueError):
+        # Both json and orjson decode errors are ValueError subclasses
         return dict(defaults)
 
 
 def _save_json(path, data):
     _ensure_config_dir()
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
-        f.write('\n')
+    # Serialize first and swap atomically so the shell extension's
+    # FileMonitor never observes a half-written document
+    data_bytes = _dumps(data)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data_bytes)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 # ---------------------------------------------------------------------------
@@ -116,259 +170,182 @@ class PrayaPreferencesWindow(Adw.PreferencesWindow):
         self._services = _load_json(SERVICES_CONFIG_PATH, DEFAULT_SERVICES_CONFIG)
         self._chatbot = _load_json(CHATBOT_CONFIG_PATH, DEFAULT_CHATBOT_CONFIG)
         self._dbus = None
-        self._posture_poll_id = None
+        self._posture_sub_id = None
         self._service_running = False
+        self._unit_path = None
+        self._unit_sub_id = None
+        self._manager_sub_id = None
+        # Status strings used from D-Bus callbacks and signal handlers —
+        # translate them once instead of on every update
+        self._STR_CHECKING = _('Checking...')
+        self._STR_RUNNING = _('Running')
+        self._STR_STOPPED = _('Stopped')
+        self._STR_UNKNOWN = _('Unknown')
+        self._STR_STATUS_ERROR = _('Error checking status')
+        self._STR_SERVICE_UNAVAIL = _('Service unavailable')
+        self._STR_DBUS_NA = _('D-Bus not available')
+        # (widget, handler_id) pairs blocked while re-applying config state
+        self._saved_handlers = []
+        # Pending debounced-save source ids (0 = no save scheduled)
+        self._services_save_id = 0
+        self._chatbot_save_id = 0
+        # One Gtk.StringList per provider, so switching providers swaps a
+        # reference instead of rebuilding the model
+        self._model_stores = {
+            k: Gtk.StringList.new(PROVIDERS[k]['models']) for k in PROVIDER_KEYS
+        }
 
         try:
             self._dbus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
         except Exception:
             self._dbus = None
 
-        self._build_panel_page()
-        self._build_services_page()
-        self._build_about_page()
-
-        # Start service status check
-        self._check_service_status()
+        # GSettings construction opens the schema and sets up a dconf
+        # watcher — do it once instead of per toggle
+        try:
+            self._iface_settings = Gio.Settings.new('org.gnome.desktop.interface')
+            self._shell_settings = Gio.Settings.new('org.gnome.shell')
+        except Exception:
+            self._iface_settings = None
+            self._shell_settings = None
 
-        # Start posture polling
-        self._start_posture_polling()
+        # Only the Panel page is needed for first paint; build the other
+        # pages (and their D-Bus plumbing) from idle so present() is not
+        # delayed by them
+        self._services_page_built = False
+        self._build_panel_page()
+        GLib.idle_add(self._build_services_page)
+        GLib.idle_add(self._build_about_page)
+
+        # Watch the config files so edits from the shell extension (or any
+        # other process) are reflected live, mirroring its FileMonitor
+        self._svc_monitor = Gio.File.new_for_path(SERVICES_CONFIG_PATH).monitor_file(
+            Gio.FileMonitorFlags.NONE, None)
+        self._svc_monitor.connect('changed', self._on_services_file_changed)
+        self._chatbot_monitor = Gio.File.new_for_path(CHATBOT_CONFIG_PATH).monitor_file(
+            Gio.FileMonitorFlags.NONE, None)
+        self._chatbot_monitor.connect('changed', self._on_chatbot_file_changed)
 
         self.connect('close-request', self._on_close)
 
+    def _connect_saved(self, widget, signal, callback):
+        """Connect a config-backed widget so the handler can be blocked
+        while a file reload re-applies its state."""
+        self._saved_handlers.append((widget, widget.connect(signal, callback)))
+
     # ==================================================================
     # Page 1: Panel
     # ==================================================================
     def _build_panel_page(self):
-        page = Adw.PreferencesPage(
-            title=_('Panel'),
-            icon_name='view-grid-symbolic',
-        )
-
-        # -- Panel Options group --
-        panel_group = Adw.PreferencesGroup(title=_('Panel Options'))
+        builder = Gtk.Builder()
+        builder.add_objects_from_file(UI_PATH, ['panel_page'])
 
         # App menu layout
-        self._layout_row = Adw.ComboRow(title=_('App menu layout'))
-        layout_model = Gtk.StringList.new([_('Grid'), _('List')])
-        self._layout_row.set_model(layout_model)
+        self._layout_row = builder.get_object('layout_row')
         self._layout_row.set_selected(0 if self._services.get('appMenuLayout', 'grid') == 'grid' else 1)
-        self._layout_row.connect('notify::selected', self._on_layout_changed)
-        panel_group.add(self._layout_row)
+        self._connect_saved(self._layout_row, 'notify::selected', self._on_layout_changed)
 
         # Position
-        self._position_row = Adw.ComboRow(title=_('Position'))
-        pos_model = Gtk.StringList.new([_('Top'), _('Bottom')])
-        self._position_row.set_model(pos_model)
+        self._position_row = builder.get_object('position_row')
         self._position_row.set_selected(0 if self._services.get('panelPosition', 'top') == 'top' else 1)
-        self._position_row.connect('notify::selected', self._on_position_changed)
-        panel_group.add(self._position_row)
+        self._connect_saved(self._position_row, 'notify::selected', self._on_position_changed)
 
         # Floating panel
-        self._floating_row = Adw.SwitchRow(title=_('Floating panel'))
+        self._floating_row = builder.get_object('floating_row')
         self._floating_row.set_active(self._services.get('floatingPanel', True))
-        self._floating_row.connect('notify::active', self._on_floating_changed)
-        panel_group.add(self._floating_row)
-
-        page.add(panel_group)
+        self._connect_saved(self._floating_row, 'notify::active', self._on_floating_changed)
 
-        # -- Activate on Hover group --
-        hover_group = Adw.PreferencesGroup(title=_('Activate on Hover'))
-
-        hover_keys = [
-            ('mainMenuHoverActivate',      _('Main menu')),
-            ('taskbarHoverActivate',        _('Taskbar')),
-            ('showDesktopHoverActivate',    _('Show Desktop')),
-            ('calendarHoverActivate',       _('Calendar')),
-            ('quickAccessHoverActivate',    _('Quick Access')),
-        ]
+        # Hover rows — the config key doubles as builder id and widget
+        # name, so one shared handler serves every row
         self._hover_rows = {}
-        for key, label in hover_keys:
-            row = Adw.SwitchRow(title=label)
+        for key in HOVER_KEYS:
+            row = builder.get_object(key)
             row.set_active(self._services.get(key, False))
-            row.connect('notify::active', lambda r, _p, k=key: self._on_hover_changed(r, k))
-            hover_group.add(row)
+            self._connect_saved(row, 'notify::active', self._on_hover_changed)
             self._hover_rows[key] = row
 
-        page.add(hover_group)
-
-        # -- Performance group --
-        perf_group = Adw.PreferencesGroup(title=_('Performance'))
-
-        self._lowspec_row = Adw.SwitchRow(title=_('Low-spec Mode'))
+        # Low-spec mode
+        self._lowspec_row = builder.get_object('lowspec_row')
         self._lowspec_row.set_active(self._services.get('lowspecEnabled', False))
-        self._lowspec_row.connect('notify::active', self._on_lowspec_changed)
-        perf_group.add(self._lowspec_row)
-
-        page.add(perf_group)
+        self._connect_saved(self._lowspec_row, 'notify::active', self._on_lowspec_changed)
 
-        self.add(page)
+        self.add(builder.get_object('panel_page'))
 
     # ==================================================================
     # Page 2: Services
     # ==================================================================
     def _build_services_page(self):
-        page = Adw.PreferencesPage(
-            title=_('Services'),
-            icon_name='preferences-system-symbolic',
-        )
-
-        # -- Praya Service group --
-        svc_group = Adw.PreferencesGroup(title=_('Praya Service'))
+        builder = Gtk.Builder()
+        builder.add_objects_from_file(UI_PATH, ['services_page'])
 
-        self._service_row = Adw.ActionRow(title=_('Status'))
-        self._service_label = Gtk.Label(label=_('Checking...'))
-        self._service_label.set_valign(Gtk.Align.CENTER)
-        self._service_row.add_suffix(self._service_label)
-
-        refresh_btn = Gtk.Button(icon_name='view-refresh-symbolic')
-        refresh_btn.set_valign(Gtk.Align.CENTER)
-        refresh_btn.connect('clicked', lambda _b: self._check_service_status())
-        self._service_row.add_suffix(refresh_btn)
-        svc_group.add(self._service_row)
-
-        page.add(svc_group)
-
-        # -- Posture Monitoring group --
-        posture_group = Adw.PreferencesGroup(
-            title=_('Posture Monitoring'),
-            description=_('(Experimental)'),
-        )
+        # Praya service status
+        self._service_label = builder.get_object('service_label')
+        builder.get_object('refresh_btn').connect('clicked', self._on_refresh_clicked)
 
-        self._posture_enable_row = Adw.SwitchRow(title=_('Enable'))
+        # Posture monitoring
+        self._posture_enable_row = builder.get_object('posture_enable_row')
         self._posture_enable_row.set_active(self._services.get('posture', False))
-        self._posture_enable_row.connect('notify::active', self._on_posture_enable_changed)
-        posture_group.add(self._posture_enable_row)
-
-        # Recalibrate button
-        recalib_row = Adw.ActionRow(title=_('Calibration'))
-        recalib_btn = Gtk.Button(label=_('Recalibrate'))
-        recalib_btn.set_valign(Gtk.Align.CENTER)
-        recalib_btn.connect('clicked', lambda _b: self._recalibrate())
-        recalib_row.add_suffix(recalib_btn)
-        posture_group.add(recalib_row)
-
-        # Live posture display
-        self._posture_status_row = Adw.ActionRow(title=_('Current'))
-        self._posture_status_label = Gtk.Label(label=_('Waiting for data...'))
-        self._posture_status_label.set_valign(Gtk.Align.CENTER)
-        self._posture_status_row.add_suffix(self._posture_status_label)
-        posture_group.add(self._posture_status_row)
-
-        # Level bar
-        self._posture_level_row = Adw.ActionRow(title=_('Level'))
-        self._posture_level_bar = Gtk.LevelBar()
-        self._posture_level_bar.set_min_value(0.0)
-        self._posture_level_bar.set_max_value(1.0)
-        self._posture_level_bar.set_value(0.0)
-        self._posture_level_bar.set_valign(Gtk.Align.CENTER)
-        self._posture_level_bar.set_hexpand(True)
-        self._posture_level_bar.set_size_request(150, -1)
-        self._posture_level_row.add_suffix(self._posture_level_bar)
-        posture_group.add(self._posture_level_row)
-
-        page.add(posture_group)
-
-        # -- Artificial Intelligence group --
-        ai_group = Adw.PreferencesGroup(
-            title=_('Artificial Intelligence'),
-            description=_('(Experimental)'),
-        )
+        self._connect_saved(self._posture_enable_row, 'notify::active', self._on_posture_enable_changed)
+        builder.get_object('recalib_btn').connect('clicked', self._on_recalibrate_clicked)
+        self._posture_status_label = builder.get_object('posture_status_label')
+        self._posture_level_bar = builder.get_object('posture_level_bar')
 
-        self._ai_enable_row = Adw.SwitchRow(title=_('Enable'))
+        # Artificial intelligence
+        self._ai_enable_row = builder.get_object('ai_enable_row')
         self._ai_enable_row.set_active(self._services.get('ai', False))
-        self._ai_enable_row.connect('notify::active', self._on_ai_enable_changed)
-        ai_group.add(self._ai_enable_row)
-
-        # Provider combo
-        self._provider_row = Adw.ComboRow(title=_('Provider'))
-        provider_names = [PROVIDERS[k]['name'] for k in PROVIDERS]
-        provider_model = Gtk.StringList.new(provider_names)
-        self._provider_row.set_model(provider_model)
-        # Set initial selection
-        provider_keys = list(PROVIDERS.keys())
+        self._connect_saved(self._ai_enable_row, 'notify::active', self._on_ai_enable_changed)
+
+        self._provider_row = builder.get_object('provider_row')
+        self._provider_row.set_model(Gtk.StringList.new(list(PROVIDER_NAMES)))
         current_provider = self._chatbot.get('provider', 'anthropic')
-        if current_provider in provider_keys:
-            self._provider_row.set_selected(provider_keys.index(current_provider))
-        self._provider_row.connect('notify::selected', self._on_provider_changed)
-        ai_group.add(self._provider_row)
+        if current_provider in PROVIDER_KEYS:
+            self._provider_row.set_selected(PROVIDER_KEYS.index(current_provider))
+        self._connect_saved(self._provider_row, 'notify::selected', self._on_provider_changed)
 
-        # Model combo
-        self._model_row = Adw.ComboRow(title=_('Model'))
+        self._model_row = builder.get_object('model_row')
         self._update_model_list()
-        self._model_row.connect('notify::selected', self._on_model_changed)
-        ai_group.add(self._model_row)
+        self._connect_saved(self._model_row, 'notify::selected', self._on_model_changed)
 
-        # API key
-        self._apikey_row = Adw.PasswordEntryRow(title=_('API Key'))
+        self._apikey_row = builder.get_object('apikey_row')
         self._apikey_row.set_text(self._chatbot.get('apiKey', ''))
-        self._apikey_row.connect('changed', self._on_apikey_changed)
-        ai_group.add(self._apikey_row)
+        self._connect_saved(self._apikey_row, 'changed', self._on_apikey_changed)
 
-        page.add(ai_group)
+        self.add(builder.get_object('services_page'))
+        self._services_page_built = True
 
-        self.add(page)
+        # Start the D-Bus plumbing now that its widgets exist
+        self._watch_service()
+        self._check_service_status()
+        self._subscribe_posture()
 
     # ==================================================================
     # Page 3: About Praya
     # ==================================================================
     def _build_about_page(self):
-        page = Adw.PreferencesPage(
-            title=_('About Praya'),
-            icon_name='help-about-symbolic',
-        )
+        builder = Gtk.Builder()
+        builder.add_objects_from_file(UI_PATH, ['about_page'])
 
-        about_group = Adw.PreferencesGroup()
+        builder.get_object('version_label').set_label(VERSION)
+        builder.get_object('source_row').connect('activated', self._on_source_activated)
 
-        # Version
-        version_row = Adw.ActionRow(title=_('Version'))
-        version_label = Gtk.Label(label=VERSION)
-        version_label.set_valign(Gtk.Align.CENTER)
-        version_row.add_suffix(version_label)
-        about_group.add(version_row)
-
-        # Author
-        author_row = Adw.ActionRow(
-            title=_('Author'),
-            subtitle='Herpiko Dwi Aguno &lt;herpiko@gmail.com&gt;',
-        )
-        about_group.add(author_row)
-
-        # Source code
-        source_row = Adw.ActionRow(
-            title=_('Source Code'),
-            subtitle='https://github.com/BlankOn/praya-gnome-shell-extension',
-            activatable=True,
-        )
-        source_row.add_suffix(Gtk.Image.new_from_icon_name('web-browser-symbolic'))
-        source_row.connect('activated', lambda *_: Gtk.show_uri(self.get_root(), 'https://github.com/BlankOn/praya-gnome-shell-extension', 0))
-        about_group.add(source_row)
-
-        # License
-        license_row = Adw.ActionRow(
-            title=_('License'),
-            subtitle='MIT',
-        )
-        about_group.add(license_row)
+        self.add(builder.get_object('about_page'))
 
-        page.add(about_group)
-        self.add(page)
+    def _on_source_activated(self, _row):
+        Gtk.show_uri(self.get_root(), 'https://github.com/BlankOn/praya-gnome-shell-extension', 0)
 
     # ==================================================================
     # Helpers — model list
     # ==================================================================
     def _current_provider_key(self):
-        keys = list(PROVIDERS.keys())
         idx = self._provider_row.get_selected()
-        if 0 <= idx < len(keys):
-            return keys[idx]
+        if 0 <= idx < len(PROVIDER_KEYS):
+            return PROVIDER_KEYS[idx]
         return 'anthropic'
 
     def _update_model_list(self):
         pkey = self._current_provider_key()
         models = PROVIDERS[pkey]['models']
-        model_store = Gtk.StringList.new(models)
-        self._model_row.set_model(model_store)
+        self._model_row.set_model(self._model_stores[pkey])
 
         # Try to select current model
         current_model = self._chatbot.get('model', '')
@@ -383,20 +360,20 @@ class PrayaPreferencesWindow(Adw.PreferencesWindow):
     def _on_layout_changed(self, row, _pspec):
         val = 'grid' if row.get_selected() == 0 else 'list'
         self._services['appMenuLayout'] = val
-        self._save_services()
+        self._schedule_save_services()
 
     def _on_position_changed(self, row, _pspec):
         val = 'top' if row.get_selected() == 0 else 'bottom'
         self._services['panelPosition'] = val
-        self._save_services()
+        self._schedule_save_services()
 
     def _on_floating_changed(self, row, _pspec):
         self._services['floatingPanel'] = row.get_active()
-        self._save_services()
+        self._schedule_save_services()
 
-    def _on_hover_changed(self, row, key):
-        self._services[key] = row.get_active()
-        self._save_services()
+    def _on_hover_changed(self, row, _pspec):
+        self._services[row.get_name()] = row.get_active()
+        self._schedule_save_services()
 
     def _on_lowspec_changed(self, row, _pspec):
         enabled = row.get_active()
@@ -404,29 +381,36 @@ class PrayaPreferencesWindow(Adw.PreferencesWindow):
 
         # Toggle GNOME animations
         try:
-            settings = Gio.Settings(schema_id='org.gnome.desktop.interface')
-            settings.set_boolean('enable-animations', not enabled)
+            if self._iface_settings:
+                self._iface_settings.set_boolean('enable-animations', not enabled)
         except Exception:
             pass
 
         # Toggle tilingshell extension
         try:
-            shell_settings = Gio.Settings(schema_id='org.gnome.shell')
-            tiling_id = 'tilingshell@ferrarodomenico.com'
-            enabled_exts = list(shell_settings.get_strv('enabled-extensions'))
-            disabled_exts = list(shell_settings.get_strv('disabled-extensions'))
-
-            if enabled:
-                enabled_exts = [x for x in enabled_exts if x != tiling_id]
-                if tiling_id not in disabled_exts:
-                    disabled_exts.append(tiling_id)
-            else:
-                disabled_exts = [x for x in disabled_exts if x != tiling_id]
-                if tiling_id not in enabled_exts:
-                    enabled_exts.append(tiling_id)
-
-            shell_settings.set_strv('enabled-extensions', enabled_exts)
-            shell_settings.set_strv('disabled-extensions', disabled_exts)
+            shell_settings = self._shell_settings
+            if shell_settings:
+                tiling_id = 'tilingshell@ferrarodomenico.com'
+                enabled_exts = shell_settings.get_strv('enabled-extensions')
+                disabled_exts = shell_settings.get_strv('disabled-extensions')
+                enabled_set = set(enabled_exts)
+                disabled_set = set(disabled_exts)
+
+                if enabled:
+                    enabled_set.discard(tiling_id)
+                    disabled_set.add(tiling_id)
+                else:
+                    disabled_set.discard(tiling_id)
+                    enabled_set.add(tiling_id)
+
+                # Only write when the lists actually changed — every
+                # set_strv is a dconf write that other listeners react to
+                new_enabled = sorted(enabled_set)
+                new_disabled = sorted(disabled_set)
+                if new_enabled != sorted(enabled_exts):
+                    shell_settings.set_strv('enabled-extensions', new_enabled)
+                if new_disabled != sorted(disabled_exts):
+                    shell_settings.set_strv('disabled-extensions', new_disabled)
         except Exception:
             pass
 
@@ -435,7 +419,7 @@ class PrayaPreferencesWindow(Adw.PreferencesWindow):
         self._services['appMenuLayout'] = new_layout
         self._layout_row.set_selected(0 if new_layout == 'grid' else 1)
 
-        self._save_services()
+        self._schedule_save_services()
 
     # ==================================================================
     # Callbacks — Services page
@@ -443,34 +427,33 @@ class PrayaPreferencesWindow(Adw.PreferencesWindow):
     def _on_posture_enable_changed(self, row, _pspec):
         enabled = row.get_active()
         self._services['posture'] = enabled
-        self._save_services()
+        self._schedule_save_services()
 
         if self._dbus and self._service_running:
             method = 'EnableService' if enabled else 'DisableService'
-            try:
-                self._dbus.call_sync(
-                    POSTURE_BUS_NAME,
-                    POSTURE_MAIN_PATH,
-                    POSTURE_MAIN_INTERFACE,
-                    method,
-                    GLib.Variant('(s)', ('posture',)),
-                    None,
-                    Gio.DBusCallFlags.NONE,
-                    -1,
-                    None,
-                )
-            except Exception:
-                pass
+            # Fire and forget — the reply is not interesting
+            self._dbus.call(
+                POSTURE_BUS_NAME,
+                POSTURE_MAIN_PATH,
+                POSTURE_MAIN_INTERFACE,
+                method,
+                GLib.Variant('(s)', ('posture',)),
+                None,
+                Gio.DBusCallFlags.NONE,
+                5000,
+                None,
+                None,
+            )
 
     def _on_ai_enable_changed(self, row, _pspec):
         enabled = row.get_active()
         self._services['ai'] = enabled
-        self._save_services()
+        self._schedule_save_services()
 
     def _on_provider_changed(self, row, _pspec):
         self._update_model_list()
         self._chatbot['provider'] = self._current_provider_key()
-        self._save_chatbot()
+        self._schedule_save_chatbot()
 
     def _on_model_changed(self, row, _pspec):
         pkey = self._current_provider_key()
@@ -478,86 +461,220 @@ class PrayaPreferencesWindow(Adw.PreferencesWindow):
         idx = row.get_selected()
         if 0 <= idx < len(models):
             self._chatbot['model'] = models[idx]
-            self._save_chatbot()
+            self._schedule_save_chatbot()
 
     def _on_apikey_changed(self, row):
         self._chatbot['apiKey'] = row.get_text()
-        self._save_chatbot()
+        self._schedule_save_chatbot()
 
     # ==================================================================
     # Service status
     # ==================================================================
+    def _watch_service(self):
+        if not self._dbus:
+            return
+
+        # systemd only emits Unit*/PropertiesChanged signals to clients
+        # that have called Manager.Subscribe()
+        self._dbus.call(
+            SYSTEMD_BUS_NAME,
+            SYSTEMD_PATH,
+            SYSTEMD_MANAGER_INTERFACE,
+            'Subscribe',
+            None,
+            None,
+            Gio.DBusCallFlags.NONE,
+            5000,
+            None,
+            None,
+        )
+
+        # UnitNew / UnitRemoved tell us when the praya unit (un)loads
+        self._manager_sub_id = self._dbus.signal_subscribe(
+            SYSTEMD_BUS_NAME,
+            SYSTEMD_MANAGER_INTERFACE,
+            None,
+            SYSTEMD_PATH,
+            None,
+            Gio.DBusSignalFlags.NONE,
+            self._on_manager_signal,
+        )
+
     def _check_service_status(self):
-        self._service_label.set_label(_('Checking...'))
+        self._service_label.set_label(self._STR_CHECKING)
+        if not self._dbus:
+            self._service_label.set_label(self._STR_STATUS_ERROR)
+            self._service_running = False
+            return
+        self._dbus.call(
+            SYSTEMD_BUS_NAME,
+            SYSTEMD_PATH,
+            SYSTEMD_MANAGER_INTERFACE,
+            'GetUnit',
+            GLib.Variant('(s)', (PRAYA_UNIT,)),
+            None,
+            Gio.DBusCallFlags.NONE,
+            5000,
+            None,
+            self._on_get_unit_reply,
+        )
+
+    def _on_get_unit_reply(self, conn, res):
         try:
-            result = subprocess.run(
-                ['systemctl', '--user', 'is-active', 'praya'],
-                capture_output=True, text=True, timeout=5,
-            )
-            status = result.stdout.strip()
-            if status == 'active':
-                self._service_label.set_label(_('Running'))
-                self._service_running = True
-            elif status == 'inactive':
-                self._service_label.set_label(_('Stopped'))
-                self._service_running = False
-            else:
-                self._service_label.set_label(status or _('Unknown'))
-                self._service_running = False
+            reply = conn.call_finish(res)
+            unit_path = reply.get_child_value(0).get_string()
+        except Exception:
+            # systemd unloads inactive units, so NoSuchUnit means stopped
+            self._set_service_state('inactive')
+            return
+        self._watch_unit(unit_path)
+        conn.call(
+            SYSTEMD_BUS_NAME,
+            unit_path,
+            DBUS_PROPERTIES_INTERFACE,
+            'Get',
+            GLib.Variant('(ss)', (SYSTEMD_UNIT_INTERFACE, 'ActiveState')),
+            None,
+            Gio.DBusCallFlags.NONE,
+            5000,
+            None,
+            self._on_active_state_reply,
+        )
+
+    def _on_active_state_reply(self, conn, res):
+        try:
+            reply = conn.call_finish(res)
+            # unpack() unwraps the (v) envelope in one native call
+            (state,) = reply.unpack()
         except Exception:
-            self._service_label.set_label(_('Error checking status'))
+            self._service_label.set_label(self._STR_STATUS_ERROR)
+            self._service_running = False
+            return
+        self._set_service_state(state)
+
+    def _set_service_state(self, state):
+        if state == 'active':
+            self._service_label.set_label(self._STR_RUNNING)
+            self._service_running = True
+        elif state == 'inactive':
+            self._service_label.set_label(self._STR_STOPPED)
+            self._service_running = False
+        else:
+            self._service_label.set_label(state or self._STR_UNKNOWN)
             self._service_running = False
 
+    def _watch_unit(self, unit_path):
+        if unit_path == self._unit_path:
+            return
+        if self._unit_sub_id is not None:
+            self._dbus.signal_unsubscribe(self._unit_sub_id)
+        self._unit_path = unit_path
+        self._unit_sub_id = self._dbus.signal_subscribe(
+            SYSTEMD_BUS_NAME,
+            DBUS_PROPERTIES_INTERFACE,
+            'PropertiesChanged',
+            unit_path,
+            None,
+            Gio.DBusSignalFlags.NONE,
+            self._on_unit_properties_changed,
+        )
+
+    def _on_manager_signal(self, _conn, _sender, _path, _iface, signal, params):
+        if signal not in ('UnitNew', 'UnitRemoved'):
+            return
+        if params.get_child_value(0).get_string() == PRAYA_UNIT:
+            self._check_service_status()
+
+    def _on_unit_properties_changed(self, _conn, _sender, _path, _iface, _signal, params):
+        iface, changed, invalidated = params.unpack()
+        if iface != SYSTEMD_UNIT_INTERFACE:
+            return
+        if 'ActiveState' in changed:
+            self._set_service_state(changed['ActiveState'])
+        elif 'ActiveState' in invalidated:
+            self._check_service_status()
+
     # ==================================================================
-    # Posture polling
+    # Posture updates
     # ==================================================================
-    def _start_posture_polling(self):
-        self._posture_poll_id = GLib.timeout_add(200, self._poll_posture)
-
-    def _poll_posture(self):
+    def _subscribe_posture(self):
         if not self._dbus:
-            self._posture_status_label.set_label(_('D-Bus not available'))
-            return GLib.SOURCE_CONTINUE
+            self._posture_status_label.set_label(self._STR_DBUS_NA)
+            return
 
+        # Event-driven: the posture service emits PostureChanged whenever
+        # the value updates, so there is no idle wakeup at all.
+        self._posture_sub_id = self._dbus.signal_subscribe(
+            POSTURE_BUS_NAME,
+            POSTURE_SERVICE_INTERFACE,
+            'PostureChanged',
+            POSTURE_SERVICE_PATH,
+            None,
+            Gio.DBusSignalFlags.NONE,
+            self._on_posture_signal,
+        )
+
+        # One async call to populate the initial values
+        self._dbus.call(
+            POSTURE_BUS_NAME,
+            POSTURE_SERVICE_PATH,
+            POSTURE_SERVICE_INTERFACE,
+            'GetUserPosture',
+            None,
+            None,
+            Gio.DBusCallFlags.NONE,
+            5000,
+            None,
+            self._on_posture_reply,
+        )
+
+    def _on_posture_signal(self, _conn, _sender, _path, _iface, _signal, params):
+        status, score = params.unpack()
+        self._show_posture(status, score)
+
+    def _on_posture_reply(self, conn, res):
         try:
-            reply = self._dbus.call_sync(
-                POSTURE_BUS_NAME,
-                POSTURE_SERVICE_PATH,
-                POSTURE_SERVICE_INTERFACE,
-                'GetUserPosture',
-                None,
-                None,
-                Gio.DBusCallFlags.NONE,
-                200,  # short timeout so we don't block
-                None,
-            )
-            status = reply.get_child_value(0).get_string()
-            score = reply.get_child_value(1).get_double()
-            self._posture_status_label.set_label(f'{status} ({score:.2f})')
-            self._posture_level_bar.set_value(max(0.0, min(1.0, score)))
+            reply = conn.call_finish(res)
+            status, score = reply.unpack()
+            self._show_posture(status, score)
         except Exception:
-            self._posture_status_label.set_label(_('Service unavailable'))
+            self._posture_status_label.set_label(self._STR_SERVICE_UNAVAIL)
             self._posture_level_bar.set_value(0.0)
 
-        return GLib.SOURCE_CONTINUE
+    def _show_posture(self, status, score):
+        # set_label emits notify::label even for equal strings, so only
+        # touch the widgets when something visibly changes
+        new_text = f'{status} ({score:.2f})'
+        if self._posture_status_label.get_label() != new_text:
+            self._posture_status_label.set_label(new_text)
+        # Deltas below ~1/150 (one pixel of the bar) are invisible but
+        # would still schedule a redraw
+        new_value = max(0.0, min(1.0, score))
+        if abs(new_value - self._posture_level_bar.get_value()) >= 0.007:
+            self._posture_level_bar.set_value(new_value)
+
+    def _on_refresh_clicked(self, _button):
+        self._check_service_status()
+
+    def _on_recalibrate_clicked(self, _button):
+        self._recalibrate()
 
     def _recalibrate(self):
         if not self._dbus:
             return
-        try:
-            self._dbus.call_sync(
-                POSTURE_BUS_NAME,
-                POSTURE_SERVICE_PATH,
-                POSTURE_SERVICE_INTERFACE,
-                'Recalibrate',
-                None,
-                None,
-                Gio.DBusCallFlags.NONE,
-                -1,
-                None,
-            )
-        except Exception:
-            pass
+        # Fire and forget — the reply is not interesting
+        self._dbus.call(
+            POSTURE_BUS_NAME,
+            POSTURE_SERVICE_PATH,
+            POSTURE_SERVICE_INTERFACE,
+            'Recalibrate',
+            None,
+            None,
+            Gio.DBusCallFlags.NONE,
+            5000,
+            None,
+            None,
+        )
 
     # ==================================================================
     # Config persistence
@@ -568,13 +685,105 @@ class PrayaPreferencesWindow(Adw.PreferencesWindow):
     def _save_chatbot(self):
         _save_json(CHATBOT_CONFIG_PATH, self._chatbot)
 
+    # Coalesce bursts of changes (typing an API key, flipping several
+    # switches) into a single write 400 ms after the last change, so the
+    # shell extension's FileMonitor fires once instead of per keystroke.
+    def _schedule_save_services(self):
+        if self._services_save_id:
+            GLib.source_remove(self._services_save_id)
+        self._services_save_id = GLib.timeout_add(400, self._flush_services)
+
+    def _flush_services(self):
+        self._services_save_id = 0
+        self._save_services()
+        return GLib.SOURCE_REMOVE
+
+    def _schedule_save_chatbot(self):
+        if self._chatbot_save_id:
+            GLib.source_remove(self._chatbot_save_id)
+        self._chatbot_save_id = GLib.timeout_add(400, self._flush_chatbot)
+
+    def _flush_chatbot(self):
+        self._chatbot_save_id = 0
+        self._save_chatbot()
+        return GLib.SOURCE_REMOVE
+
+    # ==================================================================
+    # Config file monitors
+    # ==================================================================
+    def _on_services_file_changed(self, _monitor, _file, _other, event):
+        if event != Gio.FileMonitorEvent.CHANGES_DONE_HINT:
+            return
+        services = _load_json(SERVICES_CONFIG_PATH, DEFAULT_SERVICES_CONFIG)
+        if services == self._services:
+            return  # our own write, or a no-op rewrite
+        self._services = services
+        self._apply_services_state()
+
+    def _on_chatbot_file_changed(self, _monitor, _file, _other, event):
+        if event != Gio.FileMonitorEvent.CHANGES_DONE_HINT:
+            return
+        chatbot = _load_json(CHATBOT_CONFIG_PATH, DEFAULT_CHATBOT_CONFIG)
+        if chatbot == self._chatbot:
+            return
+        self._chatbot = chatbot
+        self._apply_chatbot_state()
+
+    def _apply_services_state(self):
+        # Block the notify:: handlers so the reload doesn't re-trigger
+        # _save_services() and loop with the other writer
+        for widget, hid in self._saved_handlers:
+            widget.handler_block(hid)
+        try:
+            self._layout_row.set_selected(0 if self._services.get('appMenuLayout', 'grid') == 'grid' else 1)
+            self._position_row.set_selected(0 if self._services.get('panelPosition', 'top') == 'top' else 1)
+            self._floating_row.set_active(self._services.get('floatingPanel', True))
+            for key, row in self._hover_rows.items():
+                row.set_active(self._services.get(key, False))
+            self._lowspec_row.set_active(self._services.get('lowspecEnabled', False))
+            if self._services_page_built:
+                self._posture_enable_row.set_active(self._services.get('posture', False))
+                self._ai_enable_row.set_active(self._services.get('ai', False))
+        finally:
+            for widget, hid in self._saved_handlers:
+                widget.handler_unblock(hid)
+
+    def _apply_chatbot_state(self):
+        if not self._services_page_built:
+            # The page build reads self._chatbot, so nothing to re-apply
+            return
+        for widget, hid in self._saved_handlers:
+            widget.handler_block(hid)
+        try:
+            current_provider = self._chatbot.get('provider', 'anthropic')
+            if current_provider in PROVIDER_KEYS:
+                self._provider_row.set_selected(PROVIDER_KEYS.index(current_provider))
+            self._update_model_list()
+            self._apikey_row.set_text(self._chatbot.get('apiKey', ''))
+        finally:
+            for widget, hid in self._saved_handlers:
+                widget.handler_unblock(hid)
+
     # ==================================================================
     # Cleanup
     # ==================================================================
     def _on_close(self, _window):
-        if self._posture_poll_id:
-            GLib.source_remove(self._posture_poll_id)
-            self._posture_poll_id = None
+        # Flush any pending debounced saves before tearing down
+        if self._services_save_id:
+            GLib.source_remove(self._services_save_id)
+            self._flush_services()
+        if self._chatbot_save_id:
+            GLib.source_remove(self._chatbot_save_id)
+            self._flush_chatbot()
+        if self._posture_sub_id is not None:
+            self._dbus.signal_unsubscribe(self._posture_sub_id)
+            self._posture_sub_id = None
+        if self._unit_sub_id is not None:
+            self._dbus.signal_unsubscribe(self._unit_sub_id)
+            self._unit_sub_id = None
+        if self._manager_sub_id is not None:
+            self._dbus.signal_unsubscribe(self._manager_sub_id)
+            self._manager_sub_id = None
         return False  # allow close
 
 
@@ -0,0 +1,15 @@
+"""Shared PyGObject setup for the Praya helper scripts.
+
+gi.require_version() must run before the first gi.repository import, and
+both praya-preferences.py and lowspec-dialog.py need the same versions —
+do it in one place so the scripts stay in sync and the typelib loading
+is paid once when they share a process.
+"""
+import gi
+
+gi.require_version('Gtk', '4.0')
+gi.require_version('Adw', '1')
+
+from gi.repository import GLib, Gtk, Adw, Gio  # noqa: E402
+
+__all__ = ['GLib', 'Gtk', 'Adw', 'Gio']